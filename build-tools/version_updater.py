@@ -4,37 +4,51 @@ parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(parent_dir)
 from version import docs_version, package_version
 
-
-def update_lines(file_path, start_with, replacement_string):
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-    
-    with open(file_path, "w") as f:
-        for line in lines:
-            if line.strip().startswith(start_with):
-                f.write(f'{replacement_string}\n')
+# Version lines to rewrite: {file path: [(line prefix, replacement line), ...]}
+RULES = {
+    '../docs/docs/index.md': [
+        ('pyPicoSDK:', f'pyPicoSDK: {package_version}'),
+        ('Docs:', f'Docs: {docs_version}'),
+    ],
+    '../setup.py': [('version=', (' '*4) + f'version="{package_version}",')],
+    '../pypicosdk/version.py': [('VERSION', f'VERSION = "{package_version}"')],
+    '../pyproject.toml': [('version = ', f'version = "{package_version}"')],
+}
+
+def update_lines(file_path, rules, verbose=False):
+    """Replaces each line starting with a rule's prefix, in a single pass over the file.
+    Lines are streamed to a temporary file which then atomically replaces the original.
+    rules: list of (prefix, replacement_string) tuples
+    verbose: write the replaced lines to stdout in one write once the file is done"""
+    replacements = dict(rules)
+    prefixes = tuple(replacements)
+    log = []
+    tmp_path = file_path + '.tmp'
+    with open(file_path, 'r') as src, open(tmp_path, 'w') as dst:
+        for line in src:
+            # Only indented lines need stripping to match their prefix
+            if line[:1].isspace():
+                line_start = line.lstrip()
             else:
-                f.write(line)
-
-def update_docs():
-    update_lines('../docs/docs/index.md', 'pyPicoSDK:', f'pyPicoSDK: {package_version}')
-    update_lines('../docs/docs/index.md', 'Docs:', f'Docs: {docs_version}')
-
-def update_setup():
-    update_lines('../setup.py', 'version=', (' '*4) + f'version="{package_version}",')
-
-def update_src():
-    update_lines('../pypicosdk/version.py', 'VERSION', f'VERSION = "{package_version}"')
-
-def update_project_toml():
-    update_lines('../pyproject.toml', 'version = ', f'version = "{package_version}"')
-
-
-def update_versions():
-    update_docs()
-    update_setup()
-    update_src()
-    update_project_toml()
+                line_start = line
+            # One C-level test against all prefixes; only matching lines find which rule hit
+            if not line_start.startswith(prefixes):
+                dst.write(line)
+                continue
+            for start_with in prefixes:
+                if line_start.startswith(start_with):
+                    replacement_string = replacements[start_with]
+                    dst.write(f'{replacement_string}\n')
+                    if verbose:
+                        log.append(f'{file_path}: replacing {line.rstrip()} -> {replacement_string}\n')
+                    break
+    os.replace(tmp_path, file_path)
+    if log:
+        sys.stdout.write(''.join(log))
+
+def update_versions(verbose=False):
+    for file_path, rules in RULES.items():
+        update_lines(file_path, rules, verbose)
 
 if __name__ == "__main__":
-    update_versions()
\ No newline at end of file
+    update_versions(verbose='--verbose' in sys.argv)
\ No newline at end of file
@@ -175,7 +175,8 @@ class RANGE(IntEnum):
     V20 = 10
     V50 = 11
 
-RANGE_LIST = [10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000]
+# Range of each RANGE value in mV, indexed by RANGE
+RANGE_LIST = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000)
 
 class BANDWIDTH_CH:
     """
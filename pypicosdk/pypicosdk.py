@@ -1,5 +1,10 @@
 import ctypes
+import functools
 import os
+import threading
+import time
+
+import numpy as np
 
 from .error_list import ERROR_STRING
 from .constants import *
@@ -13,6 +18,26 @@ class PicoSDKException(Exception):
     pass
 
 
+# NumPy dtype for each PicoSDK DATA_TYPE
+_DTYPE_MAP = {
+    DATA_TYPE.INT8_T: np.int8,
+    DATA_TYPE.INT16_T: np.int16,
+    DATA_TYPE.INT32_T: np.int32,
+    DATA_TYPE.INT64_T: np.int64,
+    DATA_TYPE.UINT32_T: np.uint32,
+}
+
+# C types used in DLL function signatures
+_HANDLE = ctypes.c_int16
+_ENUM = ctypes.c_int32
+_PTR = ctypes.c_void_p
+_STATUS = ctypes.c_uint32
+
+# psXXXXBlockReady(int16_t handle, PICO_STATUS status, void *pParameter), __stdcall on Windows
+_CALLBACK_TYPE = ctypes.WINFUNCTYPE if os.name == 'nt' else ctypes.CFUNCTYPE
+_BLOCK_READY = _CALLBACK_TYPE(None, _HANDLE, _STATUS, ctypes.c_void_p)
+
+
 # General Functions
 def _legacy_get_lib_path() -> str:    
     """
@@ -34,10 +59,38 @@ def _get_lib_path() -> str:
     package_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(package_dir, "lib")
 
+class _LazyDLL:
+    """
+    Class attribute that loads a PicoSDK DLL on first access.
+
+    The loaded DLL replaces this descriptor on the owning class and its
+    function signatures are bound, so both happen once per class.
+    """
+    def __init__(self, dll_name: str):
+        self.dll_name = dll_name
+
+    def __get__(self, instance, owner) -> ctypes.CDLL:
+        dll = ctypes.CDLL(os.path.join(_get_lib_path(), self.dll_name))
+        setattr(owner, 'dll', dll)
+        owner._bind_signatures()
+        return dll
+
 
 # PicoScope Classes
 class PicoScopeBase:
     """PicoScope base class including common SDK and python modules and functions"""
+    # DLL function signatures: {function suffix: ([argtypes], restype)}
+    _SIGNATURES = {}
+
+    # Reusable out-parameters for one-shot queries, shared by all instances
+    _scratch_lock = threading.Lock()
+    _scratch_min = ctypes.c_int32()
+    _scratch_max = ctypes.c_int32()
+    _scratch_int16 = ctypes.c_int16()
+
+    # C type of RunBlock's timeIndisposedMs out-parameter
+    _time_indisposed_type = ctypes.c_int32
+
     # Class Functions
     def __init__(self):
         self.handle = ctypes.c_short()
@@ -45,14 +98,74 @@ class PicoScopeBase:
         self.resolution = None
         self.max_adc_value = None
         self.min_adc_value = None
+        self._data_buffers = {}
+        self._buffer_pool = {}
+        self._enabled_channels_buffer_key = None
+        # No unit is open until open_unit() succeeds
+        self._closed = True
+        self._unit_info_cache = {}
+        self._block_ready = None
+        self._block_callbacks = []
+    
+    @property
+    def max_adc_value(self) -> int:
+        "Maximum ADC value of the device, set when the unit is opened"
+        return self._max_adc_value
+
+    @max_adc_value.setter
+    def max_adc_value(self, value: int) -> None:
+        # Precompute per-range scale factors so conversions are a single multiply
+        self._max_adc_value = value
+        if value is None:
+            self._adc_to_mv_scale = self._mv_to_adc_scale = None
+        else:
+            self._adc_to_mv_scale = tuple(range_mv / value for range_mv in RANGE_LIST)
+            self._mv_to_adc_scale = tuple(value / range_mv for range_mv in RANGE_LIST)
     
-    def __exit__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
         self.close_unit()
 
     def __del__(self):
-        self.close_unit()
+        # __init__ may not have completed
+        if not getattr(self, '_closed', True):
+            self.close_unit()
 
     # General Functions
+    @classmethod
+    def _bind_signatures(cls) -> None:
+        """
+        Sets argtypes/restype on each DLL function listed in `_SIGNATURES`.
+
+        Declaring the signature once lets ctypes convert arguments in C
+        rather than inferring each argument type on every call. Called when
+        the DLL is first loaded.
+        """
+        for function_name, (argtypes, restype) in cls._SIGNATURES.items():
+            attr_function = getattr(cls.dll, cls._unit_prefix_n + function_name)
+            attr_function.argtypes = argtypes
+            attr_function.restype = restype
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolve(cls, function_name: str) -> ctypes.CDLL:
+        """
+        Resolves and caches a DLL function for the class.
+
+        Every instance of a class shares the same DLL, so the lookup is
+        cached per class rather than per instance. Resolving the first
+        function loads the DLL and binds its signatures.
+
+        Args:
+            function_name (str): PicoSDK function name, e.g., "OpenUnit".
+
+        Returns:
+            ctypes.CDLL: CDLL function for the specified name.
+        """
+        return getattr(cls.dll, cls._unit_prefix_n + function_name)
+
     def _get_attr_function(self, function_name: str) -> ctypes.CDLL:
         """
         Returns ctypes function based on sub-class prefix name.
@@ -65,7 +178,7 @@ class PicoScopeBase:
         Returns:
             ctypes.CDLL: CDLL function for the specified name.
         """
-        return getattr(self.dll, self._unit_prefix_n + function_name)
+        return type(self)._resolve(function_name)
     
     def _error_handler(self, status: int) -> None:
         """
@@ -121,6 +234,9 @@ class PicoScopeBase:
             serial_number, 
             resolution
         )
+        self._closed = False
+        self._unit_info_cache.clear()
+        self._enabled_channels_buffer_key = None
         self.resolution = resolution
     
     def close_unit(self) -> int:
@@ -128,58 +244,82 @@ class PicoScopeBase:
         Closes the PicoScope device and releases the hardware handle.
 
         This calls the PicoSDK `CloseUnit` function to properly disconnect from the device.
+        Calling it again on a closed unit (e.g. via `__exit__` then `__del__`) does nothing.
 
         Returns:
                 None
         """
-
+        if self._closed:
+            return
         self._get_attr_function('CloseUnit')(self.handle)
+        self._closed = True
 
-    def is_ready(self) -> None:
+    def is_ready(self, poll_interval_s: float = 0.0001) -> None:
         """
         Blocks execution until the PicoScope device is ready.
 
         Continuously calls the PicoSDK `IsReady` function in a loop, checking if
-        the device is prepared to proceed with data acquisition.
+        the device is prepared to proceed with data acquisition. Sleeps between
+        checks to release the GIL rather than spinning a CPU core.
+
+        Args:
+                poll_interval_s (float, optional): Time in seconds to sleep between checks.
 
         Returns:
                 None
         """
 
         ready = ctypes.c_int16()
-        attr_function = getattr(self.dll, self._unit_prefix_n + "IsReady")
+        ready_ref = ctypes.byref(ready)
+        handle = self.handle
+        attr_function = self._get_attr_function('IsReady')
         while True:
             status = attr_function(
-                self.handle, 
-                ctypes.byref(ready)
+                handle, 
+                ready_ref
             )
             self._error_handler(status)
             if ready.value != 0:
                 break
+            time.sleep(poll_interval_s)
     
     # Get information from PicoScope
     def get_unit_info(self, unit_info: UNIT_INFO) -> str:
         """
         Get specified information from unit. Use UNIT_INFO.XXXX or integer.
 
+        Unit information does not change while the unit is open, so each
+        value is cached until the unit is reopened.
+
         Args:
             unit_info (UNIT_INFO): Specify information from PicoScope unit i.e. UNIT_INFO.PICO_BATCH_AND_SERIAL.
 
         Returns:
             str: Returns data from device.
         """
-        string = ctypes.create_string_buffer(16)
-        string_length = ctypes.c_int16(32)
-        required_size = ctypes.c_int16(32)
-        status = self._call_attr_function(
-            'GetUnitInfo',
-            self.handle,
-            string,
-            string_length,
-            ctypes.byref(required_size),
-            ctypes.c_uint32(unit_info)
-        )
-        return string.value.decode()
+        if unit_info in self._unit_info_cache:
+            return self._unit_info_cache[unit_info]
+        string_length = 64
+        required_size = self._scratch_int16
+        with self._scratch_lock:
+            while True:
+                string = ctypes.create_string_buffer(string_length)
+                required_size.value = 0
+                self._call_attr_function(
+                    'GetUnitInfo',
+                    self.handle,
+                    string,
+                    string_length,
+                    ctypes.byref(required_size),
+                    unit_info
+                )
+                # Only call again if the driver reports the string was truncated
+                if required_size.value <= string_length:
+                    break
+                string_length = required_size.value
+        info = string.value.decode()
+        self._unit_info_cache[unit_info] = info
+        return info
     
     def get_unit_serial(self) -> str:
         """
@@ -250,7 +390,7 @@ class PicoScopeBase:
         """
         time_interval_ns = ctypes.c_double()
         max_samples = ctypes.c_uint64()
-        attr_function = getattr(self.dll, self._unit_prefix_n + 'GetTimebase')
+        attr_function = self._get_attr_function('GetTimebase')
         status = attr_function(
             self.handle,
             timebase,
@@ -280,7 +420,7 @@ class PicoScopeBase:
         """
         time_interval_ns = ctypes.c_float()
         max_samples = ctypes.c_int32()
-        attr_function = getattr(self.dll, self._unit_prefix_n + 'GetTimeBase2')
+        attr_function = self._get_attr_function('GetTimebase2')
         status = attr_function(
             self.handle,
             timebase,
@@ -307,16 +447,18 @@ class PicoScopeBase:
         """
         if self.resolution is None:
             raise PicoSDKException("Device has not been initialized, use open_unit()")
-        min_value = ctypes.c_int32()
-        max_value = ctypes.c_int32()
-        self._call_attr_function(
-            'GetAdcLimits',
-            self.handle,
-            self.resolution,
-            ctypes.byref(min_value),
-            ctypes.byref(max_value)
-        )
-        return min_value.value, max_value.value
+        min_value = self._scratch_min
+        max_value = self._scratch_max
+        with self._scratch_lock:
+            min_value.value = max_value.value = 0
+            self._call_attr_function(
+                'GetAdcLimits',
+                self.handle,
+                self.resolution,
+                ctypes.byref(min_value),
+                ctypes.byref(max_value)
+            )
+            return min_value.value, max_value.value
     
     def _get_maximum_adc_value(self) -> int:
         """
@@ -327,13 +469,15 @@ class PicoScopeBase:
         Returns:
                 int: Maximum ADC value.
         """
-        max_value = ctypes.c_int16()
-        self._call_attr_function(
-            'MaximumValue',
-            self.handle,
-            ctypes.byref(max_value)
-        )
-        return max_value.value
+        max_value = self._scratch_int16
+        with self._scratch_lock:
+            max_value.value = 0
+            self._call_attr_function(
+                'MaximumValue',
+                self.handle,
+                ctypes.byref(max_value)
+            )
+            return max_value.value
     
     def get_time_axis(self, timebase:int, samples:int) -> list:
         """
@@ -364,30 +508,51 @@ class PicoScopeBase:
         Returns:
                 int: ADC value corresponding to the input millivolt value.
         """
-        channel_range_mv = RANGE_LIST[channel_range]
-        return int((mv / channel_range_mv) * self.max_adc_value)
+        return int(mv * self._mv_to_adc_scale[channel_range])
     
     def adc_to_mv(self, adc: int, channel_range: int):
         "Converts ADC value to mV - based on maximum ADC value"
-        channel_range_mv = float(RANGE_LIST[channel_range])
-        return (float(adc) / float(self.max_adc_value)) * channel_range_mv
+        return adc * self._adc_to_mv_scale[channel_range]
     
-    def buffer_adc_to_mv(self, buffer: list, channel: str) -> list:
-        """Converts an ADC buffer list to mV list"""
-        return [self.adc_to_mv(sample, self.range[channel]) for sample in buffer]
+    def buffer_adc_to_mv(self, buffer: list, channel: str) -> np.ndarray:
+        """
+        Converts an ADC buffer to mV in a single vectorized operation.
+
+        Args:
+            buffer (ctypes.Array | np.ndarray | list): ADC samples to convert.
+            channel (CHANNEL): Channel the buffer was captured on.
+
+        Returns:
+            np.ndarray: Buffer values in millivolts (mV).
+        """
+        scale = self._adc_to_mv_scale[self.range[channel]]
+        return self.buffer_ctypes_to_list(buffer) * scale
     
     def channels_buffer_adc_to_mv(self, channels_buffer: dict) -> dict:
-        "Converts dict of multiple channels adc values to millivolts (mV)"
-        for channel in channels_buffer:
-            channels_buffer[channel] = self.buffer_adc_to_mv(channels_buffer[channel], channel)
+        """
+        Converts dict of multiple channels adc values to millivolts (mV).
+
+        Equal-length buffers are stacked and scaled in one broadcast multiply.
+        """
+        buffers = [self.buffer_ctypes_to_list(buffer) for buffer in channels_buffer.values()]
+        if len(buffers) < 2 or len({buffer.shape for buffer in buffers}) != 1:
+            for channel, buffer in zip(channels_buffer, buffers):
+                channels_buffer[channel] = self.buffer_adc_to_mv(buffer, channel)
+            return channels_buffer
+        scales = np.array([self._adc_to_mv_scale[self.range[channel]] for channel in channels_buffer])
+        channels_mv = np.stack(buffers) * scales[:, None]
+        for channel, buffer_mv in zip(channels_buffer, channels_mv):
+            channels_buffer[channel] = buffer_mv
         return channels_buffer
     
-    def buffer_ctypes_to_list(self, ctypes_list):
-        "Converts a ctype dataset into a python list of samples"
-        return [sample for sample in ctypes_list]
+    def buffer_ctypes_to_list(self, ctypes_list) -> np.ndarray:
+        "Converts a ctype dataset into a numpy array of samples (zero-copy for ctypes arrays)"
+        if isinstance(ctypes_list, ctypes.Array):
+            return np.ctypeslib.as_array(ctypes_list)
+        return np.asarray(ctypes_list)
     
     def channels_buffer_ctype_to_list(self, channels_buffer):
-        "Takes a ctypes channel dictionary buffer and converts into a integer array."
+        "Takes a channel dictionary buffer and converts into numpy arrays (no-op for numpy buffers)."
         for channel in channels_buffer:
             channels_buffer[channel] = self.buffer_ctypes_to_list(channels_buffer[channel])
         return channels_buffer
@@ -409,20 +574,20 @@ class PicoScopeBase:
     def _set_channel_on(self, channel, range, coupling=COUPLING.DC, offset=0.0, bandwidth=BANDWIDTH_CH.FULL):
         """Sets a channel to ON at a specified range (6000E)"""
         self.range[channel] = range
-        attr_function = getattr(self.dll, self._unit_prefix_n + 'SetChannelOn')
+        attr_function = self._get_attr_function('SetChannelOn')
         status = attr_function(
             self.handle,
             channel,
             coupling,
             range,
-            ctypes.c_double(offset),
+            offset,
             bandwidth
         )
         return self._error_handler(status)
     
     def _set_channel_off(self, channel):
         """Sets a channel to OFF (6000E)"""
-        attr_function = getattr(self.dll, self._unit_prefix_n + 'SetChannelOff')
+        attr_function = self._get_attr_function('SetChannelOff')
         status = attr_function(
             self.handle, 
             channel
@@ -432,13 +597,14 @@ class PicoScopeBase:
     def _set_channel(self, channel, range, enabled=True, coupling=COUPLING.DC, offset=0.0):
         """Set a channel ON with a specified range (5000D)"""
         self.range[channel] = range
-        status = self.dll.ps5000aSetChannel(
+        attr_function = self._get_attr_function('SetChannel')
+        status = attr_function(
             self.handle,
             channel,
             enabled,
             coupling,
             range,
-            ctypes.c_float(offset)
+            offset
         )
         return self._error_handler(status)
     
@@ -469,24 +635,49 @@ class PicoScopeBase:
     def set_data_buffer_for_enabled_channels():
         raise NotImplemented("Method not yet available for this oscilloscope")
     
-    def _set_data_buffer_ps5000a(self, channel, samples, segment=0, ratio_mode=0):
+    def _get_pooled_buffer(self, channel, samples, segment, ratio_mode, dtype) -> np.ndarray:
+        """
+        Returns a zeroed data buffer for a channel/segment/ratio mode, reusing the
+        previous allocation when the number of samples and dtype are unchanged.
+
+        Args:
+            channel (int): Channel the buffer is for.
+            samples (int): Number of samples in the buffer.
+            segment (int): Memory segment the buffer is for.
+            ratio_mode (RATIO_MODE): Down-sampling mode the buffer is for.
+            dtype (np.dtype): NumPy dtype of the buffer.
+
+        Returns:
+            np.ndarray: Zero-filled buffer of `samples` elements.
+        """
+        key = (channel, segment, ratio_mode)
+        buffer = self._buffer_pool.get(key)
+        if buffer is not None and buffer.size == samples and buffer.dtype == dtype:
+            buffer.fill(0)
+        else:
+            buffer = np.zeros(samples, dtype=dtype)
+            self._buffer_pool[key] = buffer
+        return buffer
+
+    def _set_data_buffer_ps5000a(self, channel, samples, segment=0, ratio_mode=0) -> np.ndarray:
         """Set data buffer (5000D)"""
-        buffer = (ctypes.c_int16 * samples)
-        buffer = buffer()
+        buffer = self._get_pooled_buffer(channel, samples, segment, ratio_mode, np.int16)
         self._call_attr_function(
             'SetDataBuffer',
             self.handle,
             channel,
-            ctypes.byref(buffer),
+            buffer.ctypes.data_as(ctypes.c_void_p),
             samples,
             segment,
             ratio_mode
         )
+        # Keep a reference so the driver's target memory outlives the caller's
+        self._data_buffers[(channel, segment, ratio_mode)] = buffer
         return buffer
     
     def _set_data_buffer_ps6000a(self, channel, samples, segment=0, 
                                  datatype=DATA_TYPE.INT16_T, ratio_mode=RATIO_MODE.RAW, 
-                                 action=ACTION.CLEAR_ALL | ACTION.ADD) -> ctypes.Array:
+                                 action=ACTION.CLEAR_ALL | ACTION.ADD) -> np.ndarray:
         """
         Allocates and assigns a data buffer for a specified channel on the 6000A series.
 
@@ -499,40 +690,48 @@ class PicoScopeBase:
             action (ACTION, optional): Action to apply to the data buffer (e.g., CLEAR_ALL | ADD).
 
         Returns:
-            ctypes.Array: A ctypes array that will be populated with data during capture.
+            np.ndarray: A numpy array that will be populated with data during capture.
+                The array is reused by later calls for the same channel, segment and ratio mode.
 
         Raises:
             PicoSDKException: If an unsupported data type is provided.
         """
-        if datatype == DATA_TYPE.INT8_T:     buffer = (ctypes.c_int8 * samples)
-        elif datatype == DATA_TYPE.INT16_T:  buffer = (ctypes.c_int16 * samples)
-        elif datatype == DATA_TYPE.INT32_T:  buffer = (ctypes.c_int32 * samples)
-        elif datatype == DATA_TYPE.INT64_T:  buffer = (ctypes.c_int64 * samples)
-        elif datatype == DATA_TYPE.UINT32_T: buffer = (ctypes.c_uint32 * samples)
-        else: raise PicoSDKException("Invalid datatype selected for buffer")
-
-        buffer = buffer()
+        if datatype not in _DTYPE_MAP:
+            raise PicoSDKException("Invalid datatype selected for buffer")
+        # Any direct registration invalidates the enabled-channels buffer set
+        self._enabled_channels_buffer_key = None
+        if action & ACTION.ADD:
+            buffer = self._get_pooled_buffer(channel, samples, segment, ratio_mode, _DTYPE_MAP[datatype])
+        else:
+            buffer = np.zeros(samples, dtype=_DTYPE_MAP[datatype])
         
         self._call_attr_function(
             'SetDataBuffer',
             self.handle,
             channel,
-            ctypes.byref(buffer),
+            buffer.ctypes.data_as(ctypes.c_void_p),
             samples,
             datatype,
             segment,
             ratio_mode,
             action
         )
+        # Keep a reference so the driver's target memory outlives the caller's
+        if action & ACTION.CLEAR_ALL:
+            self._data_buffers.clear()
+        if action & ACTION.ADD:
+            self._data_buffers[(channel, segment, ratio_mode)] = buffer
         return buffer
     
     # Run functions
-    def run_block_capture(self, timebase, samples, pre_trig_percent=50, segment=0) -> int:
+    def run_block_capture(self, timebase, samples, pre_trig_percent=50, segment=0) -> float:
         """
         Runs a block capture using the specified timebase and number of samples.
 
         This sets up the PicoScope to begin collecting a block of data, divided into
         pre-trigger and post-trigger samples. It uses the PicoSDK `RunBlock` function.
+        The driver signals completion through a block-ready callback which
+        `get_values()` waits on.
 
         Args:
                 timebase (int): Timebase value determining sample interval (refer to PicoSDK guide).
@@ -541,12 +740,24 @@ class PicoScopeBase:
                 segment (int, optional): Memory segment index to use.
 
         Returns:
-                int: Estimated time (in milliseconds) the device will be busy capturing data.
+                float: Estimated time (in milliseconds) the device will be busy capturing data.
         """
 
-        pre_samples = int((samples * pre_trig_percent) / 100)
-        post_samples = int(samples - pre_samples)
-        time_indisposed_ms = ctypes.c_int32()
+        pre_samples = int(samples * pre_trig_percent // 100)
+        post_samples = samples - pre_samples
+        time_indisposed_ms = self._time_indisposed_type()
+        # Each capture's event carries the status the driver reports for it
+        block_ready = threading.Event()
+        block_ready.status = 0
+
+        def block_ready_callback(handle, status, parameter):
+            block_ready.status = status
+            block_ready.set()
+
+        # Callbacks of earlier captures stay alive until the driver has called them
+        self._block_callbacks = [(event, callback) for event, callback in self._block_callbacks
+                                 if not event.is_set()]
+        callback = _BLOCK_READY(block_ready_callback)
         self._call_attr_function(
             'RunBlock',
             self.handle,
@@ -555,17 +766,21 @@ class PicoScopeBase:
             timebase,
             ctypes.byref(time_indisposed_ms),
             segment,
-            None,
+            callback,
             None
         )
+        self._block_callbacks.append((block_ready, callback))
+        self._block_ready = block_ready
         return time_indisposed_ms.value
     
-    def get_values(self, samples, start_index=0, segment=0, ratio=0, ratio_mode=RATIO_MODE.RAW) -> int:
+    def get_values(self, samples, start_index=0, segment=0, ratio=0, ratio_mode=RATIO_MODE.RAW,
+                   timeout_s:float=None) -> int:
         """
         Retrieves a block of captured samples from the device once it's ready.
 
-        This function should be called after confirming the device is ready using `is_ready()`.
-        It invokes the underlying PicoSDK `GetValues` function to read the data into memory.
+        If a capture was started with `run_block_capture()` this waits for its block-ready
+        callback, otherwise it polls `is_ready()`. It then invokes the underlying PicoSDK
+        `GetValues` function to read the data into memory.
 
         Args:
                 samples (int): Number of samples to retrieve.
@@ -573,12 +788,24 @@ class PicoScopeBase:
                 segment (int, optional): Memory segment index to retrieve data from.
                 ratio (int, optional): Downsampling ratio.
                 ratio_mode (RATIO_MODE, optional): Ratio mode for downsampling. 
+                timeout_s (float, optional): Seconds to wait for the block-ready callback.
+                        Waits indefinitely if None.
 
         Returns:
                 int: Actual number of samples retrieved.
+
+        Raises:
+                PicoSDKException: If `timeout_s` elapses before the capture completes. The
+                        capture is left pending, so get_values() can be called again to keep waiting.
         """
 
-        self.is_ready()
+        if self._block_ready is not None:
+            if not self._block_ready.wait(timeout_s):
+                raise PicoSDKException("Timed out waiting for block capture to complete")
+            block_ready, self._block_ready = self._block_ready, None
+            self._error_handler(block_ready.status)
+        else:
+            self.is_ready()
         total_samples = ctypes.c_uint32(samples)
         overflow = ctypes.c_int16()
         self._call_attr_function(
@@ -644,7 +871,7 @@ class PicoScopeBase:
         self._call_attr_function(
             'SigGenFrequency',
             self.handle,
-            ctypes.c_double(frequency)
+            frequency
         )
 
     def _siggen_set_duty_cycle(self, duty:float) -> None:
@@ -657,7 +884,7 @@ class PicoScopeBase:
         self._call_attr_function(
             'SigGenWaveformDutyCycle',
             self.handle,
-            ctypes.c_double(duty)
+            duty
         )
     
     def _siggen_set_range(self, pk2pk:float, offset:float=0.0):
@@ -671,8 +898,8 @@ class PicoScopeBase:
         self._call_attr_function(
             'SigGenRange',
             self.handle,
-            ctypes.c_double(pk2pk),
-            ctypes.c_double(offset)
+            pk2pk,
+            offset
         )
     
     def _siggen_set_waveform(self, wave_type: WAVEFORM):
@@ -697,8 +924,29 @@ class PicoScopeBase:
 
 class ps6000a(PicoScopeBase):
     """PicoScope 6000 (A) API specific functions"""
-    dll = ctypes.CDLL(os.path.join(_get_lib_path(), "ps6000a.dll"))
+    dll = _LazyDLL("ps6000a.dll")
     _unit_prefix_n = "ps6000a"
+    _time_indisposed_type = ctypes.c_double
+    _SIGNATURES = {
+        "OpenUnit": ([_PTR, ctypes.c_char_p, _ENUM], _STATUS),
+        "CloseUnit": ([_HANDLE], _STATUS),
+        "IsReady": ([_HANDLE, _PTR], _STATUS),
+        "GetUnitInfo": ([_HANDLE, _PTR, ctypes.c_int16, _PTR, ctypes.c_uint32], _STATUS),
+        "NearestSampleIntervalStateless": ([_HANDLE, ctypes.c_uint32, ctypes.c_double, _ENUM, _PTR, _PTR], _STATUS),
+        "GetTimebase": ([_HANDLE, ctypes.c_uint32, ctypes.c_uint64, _PTR, _PTR, ctypes.c_uint64], _STATUS),
+        "GetAdcLimits": ([_HANDLE, _ENUM, _PTR, _PTR], _STATUS),
+        "SetChannelOn": ([_HANDLE, _ENUM, _ENUM, _ENUM, ctypes.c_double, _ENUM], _STATUS),
+        "SetChannelOff": ([_HANDLE, _ENUM], _STATUS),
+        "SetSimpleTrigger": ([_HANDLE, ctypes.c_int16, _ENUM, ctypes.c_int16, _ENUM, ctypes.c_uint64, ctypes.c_uint32], _STATUS),
+        "SetDataBuffer": ([_HANDLE, _ENUM, _PTR, ctypes.c_int32, _ENUM, ctypes.c_uint64, ctypes.c_uint32, ctypes.c_uint32], _STATUS),
+        "RunBlock": ([_HANDLE, ctypes.c_uint64, ctypes.c_uint64, ctypes.c_uint32, _PTR, ctypes.c_uint64, _PTR, _PTR], _STATUS),
+        "GetValues": ([_HANDLE, ctypes.c_uint64, _PTR, ctypes.c_uint64, ctypes.c_uint32, ctypes.c_uint64, _PTR], _STATUS),
+        "SigGenApply": ([_HANDLE] + [ctypes.c_int16] * 5 + [_PTR] * 4, _STATUS),
+        "SigGenFrequency": ([_HANDLE, ctypes.c_double], _STATUS),
+        "SigGenWaveformDutyCycle": ([_HANDLE, ctypes.c_double], _STATUS),
+        "SigGenRange": ([_HANDLE, ctypes.c_double, ctypes.c_double], _STATUS),
+        "SigGenWaveform": ([_HANDLE, _ENUM, _PTR, ctypes.c_uint64], _STATUS),
+    }
 
     def open_unit(self, serial_number:str=None, resolution:RESOLUTION = 0) -> None:
         """
@@ -746,7 +994,7 @@ class ps6000a(PicoScopeBase):
             super()._set_channel_off(channel)
     
     def set_data_buffer(self, channel:CHANNEL, samples:int, segment:int=0, datatype:DATA_TYPE=DATA_TYPE.INT16_T, 
-                        ratio_mode:RATIO_MODE=RATIO_MODE.RAW, action:ACTION=ACTION.CLEAR_ALL | ACTION.ADD) -> ctypes.Array:
+                        ratio_mode:RATIO_MODE=RATIO_MODE.RAW, action:ACTION=ACTION.CLEAR_ALL | ACTION.ADD) -> np.ndarray:
         """
         Tells the driver where to store the data that will be populated when get_values() is called.
         This function works on a single buffer. For aggregation mode, call set_data_buffers instead.
@@ -760,7 +1008,9 @@ class ps6000a(PicoScopeBase):
                 action (ACTION, optional): Method to use when creating a buffer.
 
         Returns:
-                ctypes.Array: Array that will be populated when get_values() is called.
+                np.ndarray: Array that will be populated when get_values() is called.
+                        The array is reused (and zeroed) by later calls for the same channel,
+                        segment, ratio mode, samples and datatype; copy it to keep data across captures.
         """
         return super()._set_data_buffer_ps6000a(channel, samples, segment, datatype, ratio_mode, action)
     
@@ -769,6 +1019,12 @@ class ps6000a(PicoScopeBase):
         """
         Sets data buffers for enabled channels set by picosdk.set_channel()
 
+        If the enabled channels and buffer settings match the previous call, the
+        buffers already registered with the driver are zeroed and reused without
+        any DLL calls. The returned arrays are then the same objects returned by
+        the previous call, so their data is wiped; copy them to keep data across
+        captures.
+
         Args:
             samples (int): The sample buffer or size to allocate.
             segment (int): The memory segment index.
@@ -777,12 +1033,24 @@ class ps6000a(PicoScopeBase):
 
         Returns:
             dict: A dictionary mapping each channel to its associated data buffer.
+                The arrays are reused (and zeroed) by later calls with the same settings.
         """
-        # Clear the buffer
-        super()._set_data_buffer_ps6000a(0, 0, 0, 0, 0, ACTION.CLEAR_ALL)
+        buffer_key = (tuple(self.range), samples, segment, datatype, ratio_mode)
+        if buffer_key == self._enabled_channels_buffer_key:
+            channels_buffer = {channel: self._data_buffers[(channel, segment, ratio_mode)] for channel in self.range}
+            for buffer in channels_buffer.values():
+                buffer.fill(0)
+            return channels_buffer
+
+        if not self.range:
+            super()._set_data_buffer_ps6000a(0, 0, 0, 0, 0, ACTION.CLEAR_ALL)
+        # First channel clears any previous buffers, the rest are added
+        action = ACTION.CLEAR_ALL | ACTION.ADD
         channels_buffer = {}
         for channel in self.range:
-            channels_buffer[channel] = super()._set_data_buffer_ps6000a(channel, samples, segment, datatype, ratio_mode, action=ACTION.ADD)
+            channels_buffer[channel] = super()._set_data_buffer_ps6000a(channel, samples, segment, datatype, ratio_mode, action)
+            action = ACTION.ADD
+        self._enabled_channels_buffer_key = buffer_key
         return channels_buffer
     
     def set_siggen(self, frequency:float, pk2pk:float, wave_type:WAVEFORM, offset:float=0.0, duty:float=50) -> dict:
@@ -853,8 +1121,22 @@ class ps6000a(PicoScopeBase):
         return channels_buffer, time_axis
     
 class ps5000a(PicoScopeBase):
-    dll = ctypes.CDLL(os.path.join(_get_lib_path(), "ps5000a.dll"))
+    dll = _LazyDLL("ps5000a.dll")
     _unit_prefix_n = "ps5000a"
+    _SIGNATURES = {
+        "OpenUnit": ([_PTR, ctypes.c_char_p, _ENUM], _STATUS),
+        "CloseUnit": ([_HANDLE], _STATUS),
+        "IsReady": ([_HANDLE, _PTR], _STATUS),
+        "GetUnitInfo": ([_HANDLE, _PTR, ctypes.c_int16, _PTR, ctypes.c_uint32], _STATUS),
+        "GetTimebase2": ([_HANDLE, ctypes.c_uint32, ctypes.c_int32, _PTR, _PTR, ctypes.c_uint32], _STATUS),
+        "MaximumValue": ([_HANDLE, _PTR], _STATUS),
+        "SetChannel": ([_HANDLE, _ENUM, ctypes.c_int16, _ENUM, _ENUM, ctypes.c_float], _STATUS),
+        "SetSimpleTrigger": ([_HANDLE, ctypes.c_int16, _ENUM, ctypes.c_int16, _ENUM, ctypes.c_uint32, ctypes.c_int16], _STATUS),
+        "SetDataBuffer": ([_HANDLE, _ENUM, _PTR, ctypes.c_int32, ctypes.c_uint32, _ENUM], _STATUS),
+        "RunBlock": ([_HANDLE, ctypes.c_int32, ctypes.c_int32, ctypes.c_uint32, _PTR, ctypes.c_uint32, _PTR, _PTR], _STATUS),
+        "GetValues": ([_HANDLE, ctypes.c_uint32, _PTR, ctypes.c_uint32, _ENUM, ctypes.c_uint32, _PTR], _STATUS),
+        "ChangePowerSource": ([_HANDLE, _STATUS], _STATUS),
+    }
 
     def open_unit(self, serial_number=None, resolution=RESOLUTION):
         status = super()._open_unit(serial_number, resolution)
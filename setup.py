@@ -16,6 +16,7 @@ setup(
     name="pypicosdk",
     version="0.2.21",
     packages=find_packages(),
+    install_requires=["numpy"],
     include_package_data=True,
     has_ext_modules=lambda : True,
     package_data={
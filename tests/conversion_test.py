@@ -1,5 +1,6 @@
+import ctypes
 import pytest
-from pypicosdk import ps6000a, RANGE, CHANNEL
+from pypicosdk import ps6000a, RANGE, RANGE_LIST, CHANNEL, RATIO_MODE, ACTION
 
 def test_mv_to_adc():
     scope = ps6000a()
@@ -15,15 +16,58 @@ def test_buffer_adc_to_mv():
     scope = ps6000a()
     scope.max_adc_value = 32000
     scope.range = {CHANNEL.A: RANGE.V10}
-    assert scope.buffer_adc_to_mv([160, 250, 1550], CHANNEL.A) == [50.0, 78.125, 484.375]
+    assert scope.buffer_adc_to_mv([160, 250, 1550], CHANNEL.A).tolist() == [50.0, 78.125, 484.375]
 
 def test_channels_buffer_adc_to_mv():
     scope = ps6000a()
     scope.max_adc_value = 32000
     scope.range = {CHANNEL.A: RANGE.V10, CHANNEL.B: RANGE.V1}
-    assert scope.channels_buffer_adc_to_mv({
+    channels_buffer = scope.channels_buffer_adc_to_mv({
         CHANNEL.A: [160, 250, 1550], 
         CHANNEL.B: [100, 2500, 6000, 23]
-        }) == {
+        })
+    assert {channel: buffer.tolist() for channel, buffer in channels_buffer.items()} == {
             CHANNEL.A: [50.0, 78.125, 484.375], 
-            CHANNEL.B: [3.125, 78.125, 187.5, 0.71875]}
\ No newline at end of file
+            CHANNEL.B: [3.125, 78.125, 187.5, 0.71875]}
+
+def test_channels_buffer_adc_to_mv_equal_length():
+    scope = ps6000a()
+    scope.max_adc_value = 32000
+    scope.range = {CHANNEL.A: RANGE.V10, CHANNEL.B: RANGE.V1}
+    channels_buffer = scope.channels_buffer_adc_to_mv({
+        CHANNEL.A: (ctypes.c_int16 * 3)(160, 250, 1550),
+        CHANNEL.B: (ctypes.c_int16 * 3)(100, 2500, 6000)
+        })
+    assert {channel: buffer.tolist() for channel, buffer in channels_buffer.items()} == {
+            CHANNEL.A: [50.0, 78.125, 484.375],
+            CHANNEL.B: [3.125, 78.125, 187.5]}
+
+def test_buffer_adc_to_mv_ctypes():
+    scope = ps6000a()
+    scope.max_adc_value = 32000
+    scope.range = {CHANNEL.A: RANGE.V10}
+    buffer = (ctypes.c_int16 * 3)(160, 250, 1550)
+    assert scope.buffer_adc_to_mv(buffer, CHANNEL.A).tolist() == [50.0, 78.125, 484.375]
+
+@pytest.mark.parametrize("ctype", [ctypes.c_int8, ctypes.c_int16, ctypes.c_int32, ctypes.c_int64, ctypes.c_uint32])
+def test_buffer_ctypes_to_list(ctype):
+    scope = ps6000a()
+    buffer = (ctype * 4)(1, 2, 3, 4)
+    samples = scope.buffer_ctypes_to_list(buffer)
+    assert samples.tolist() == [1, 2, 3, 4]
+    assert samples.itemsize == ctypes.sizeof(ctype)
+    buffer[0] = 5
+    assert samples[0] == 5
+
+def test_range_list_indexed_by_range():
+    assert len(RANGE_LIST) == len(RANGE)
+    assert RANGE_LIST[RANGE.mV10] == 10
+    assert RANGE_LIST[RANGE.V50] == 50000
+
+def test_set_data_buffer_ratio_modes_get_separate_arrays():
+    scope = ps6000a()
+    scope._get_attr_function = lambda function_name: lambda *args: 0
+    raw = scope.set_data_buffer(CHANNEL.A, 10, ratio_mode=RATIO_MODE.RAW)
+    average = scope.set_data_buffer(CHANNEL.A, 10, ratio_mode=RATIO_MODE.AVERAGE, action=ACTION.ADD)
+    assert raw is not average
+    assert scope.set_data_buffer(CHANNEL.A, 10, ratio_mode=RATIO_MODE.RAW, action=ACTION.ADD) is raw